@@ -0,0 +1,115 @@
+"""球员分析基准测试：对比遍历ORM对象的逐条计算与compute_player_analytics()的列数组向量化计算
+
+用法：python benchmarks/bench_analytics.py [--players 10000] [--records 1000000]
+
+在临时SQLite数据库中为一个项目写入测试数据，分别计时：
+ORM循环（按项目加载球员及其训练记录，Python逐条求均值/方差/趋势斜率/百分位/BMI）、
+向量化计算（一次查询取列数组 + NumPy分组），以及AnalyticsCache命中时的耗时。
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+from datetime import datetime, timedelta
+
+tmp = tempfile.TemporaryDirectory()
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(tmp.name, 'bench.db')}"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+from sqlalchemy.orm import selectinload  # noqa: E402
+from app import app, db, Sport, Player, TrainingRecord, compute_player_analytics, analytics_cache  # noqa: E402
+
+EPOCH = datetime(1970, 1, 1)
+
+
+def populate(players, records):
+    rnd = random.Random(42)
+    base = datetime(2023, 1, 1)
+    db.session.add(Sport(id=1, name='篮球', positions=''))
+    db.session.execute(db.insert(Player), [
+        dict(id=i, name=f'p{i}', number=i % 99, position='x', sport_id=1,
+             height=rnd.uniform(160, 210), weight=rnd.uniform(55, 110), join_date=base)
+        for i in range(1, players + 1)])
+    batch = []
+    for i in range(records):
+        batch.append(dict(player_id=rnd.randint(1, players), score=rnd.randint(1, 10),
+                          record_time=base + timedelta(minutes=rnd.randint(0, 600000))))
+        if len(batch) == 50000:
+            db.session.execute(db.insert(TrainingRecord), batch)
+            batch = []
+    if batch:
+        db.session.execute(db.insert(TrainingRecord), batch)
+    db.session.commit()
+
+
+def orm_loop(sport_id):
+    """改造前的写法：加载ORM对象后在Python中逐名球员、逐条记录计算"""
+    players = Player.query.options(selectinload(Player.training_records)).filter_by(sport_id=sport_id).all()
+    results = {}
+    for player in players:
+        scores = [r.score for r in player.training_records if r.score is not None]
+        days = [(r.record_time - EPOCH).total_seconds() / 86400 for r in player.training_records if r.score is not None]
+        height = player.height / 100 if player.height > 3 else player.height
+        result = {'count': len(scores), 'bmi': player.weight / (height * height)}
+        if scores:
+            mean = sum(scores) / len(scores)
+            mean_day = sum(days) / len(days)
+            day_var = sum((d - mean_day) ** 2 for d in days)
+            result['mean'] = mean
+            result['variance'] = sum((s - mean) ** 2 for s in scores) / len(scores)
+            result['slope'] = sum((d - mean_day) * (s - mean) for d, s in zip(days, scores)) / day_var if day_var else 0.0
+        results[player.id] = result
+    means = sorted(r['mean'] for r in results.values() if r['count'])
+    for result in results.values():
+        if result['count']:
+            below = sum(1 for m in means if m < result['mean'])
+            equal = sum(1 for m in means if m == result['mean'])
+            result['percentile'] = (below + equal / 2) / len(means) * 100
+    return results
+
+
+def timed(label, func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    print(f'{label:<14} {(time.perf_counter() - start) * 1000:10.1f} ms')
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--players', type=int, default=10000)
+    parser.add_argument('--records', type=int, default=1000000)
+    args = parser.parse_args()
+
+    with app.app_context():
+        db.create_all()
+        populate(args.players, args.records)
+        print(f'{args.players}名球员，{args.records}条训练记录')
+
+        vectorized = timed('向量化计算', compute_player_analytics, 1)
+        db.session.expunge_all()
+        looped = timed('ORM循环', orm_loop, 1)
+        timed('缓存未命中', analytics_cache.get, 1)
+        timed('缓存命中', analytics_cache.get, 1)
+
+        # 校验两种算法结果一致
+        sample = [i for i, player_id in enumerate(vectorized.player_ids) if looped[player_id]['count']][:100]
+        for i in sample:
+            expected = looped[int(vectorized.player_ids[i])]
+            assert np.isclose(vectorized.means[i], expected['mean'])
+            assert np.isclose(vectorized.variances[i], expected['variance'])
+            assert np.isclose(vectorized.slopes[i], expected['slope'], atol=1e-9)
+            assert np.isclose(vectorized.percentiles[i], expected['percentile'])
+            assert np.isclose(vectorized.bmi[i], expected['bmi'])
+        print(f'抽查{len(sample)}名球员，两种算法结果一致')
+        db.session.remove()
+        for engine in db.engines.values():
+            engine.dispose()
+    tmp.cleanup()
+
+
+if __name__ == '__main__':
+    main()
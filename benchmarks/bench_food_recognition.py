@@ -0,0 +1,98 @@
+"""食物识别吞吐量基准测试：对比逐张识别与FoodInferenceBatcher凑批识别
+
+用法：python benchmarks/bench_food_recognition.py [--foods 20] [--refs 20] [--images 400] [--clients 16]
+
+在临时目录生成合成参考图片（每种食物一种主色调加噪声）并构建特征索引，
+再由多个客户端线程并发调用detect_food_local()识别互不相同的图片（关闭识别结果缓存），
+分别统计FOOD_BATCH_MAX_SIZE=1（每次只处理一张）与默认批大小下的吞吐量和延迟。
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+from PIL import Image  # noqa: E402
+import app as app_module  # noqa: E402
+from app import app, CALORIE_DATABASE, FoodRecognizer, RecognitionCache, detect_food_local, food_batcher  # noqa: E402
+
+
+def synthetic_image(rng, color, size=256):
+    pixels = np.clip(rng.normal(color, 40, (size, size, 3)), 0, 255).astype(np.uint8)
+    return Image.fromarray(pixels)
+
+
+def prepare(tmp, foods, refs, images):
+    rng = np.random.default_rng(42)
+    names = CALORIE_DATABASE.search_index.names[:foods]
+    colors = {name: rng.integers(0, 256, 3) for name in names}
+    ref_folder = os.path.join(tmp, 'food_refs')
+    for name in names:
+        os.makedirs(os.path.join(ref_folder, name))
+        for i in range(refs):
+            synthetic_image(rng, colors[name]).save(os.path.join(ref_folder, name, f'{i}.jpg'), quality=85)
+    paths = []
+    for i in range(images):
+        path = os.path.join(tmp, f'query{i}.jpg')
+        synthetic_image(rng, colors[names[i % len(names)]], 640).save(path, quality=85)
+        paths.append(path)
+    return ref_folder, paths
+
+
+def run(label, paths, clients):
+    latencies = []
+    lock = threading.Lock()
+    chunks = [paths[i::clients] for i in range(clients)]
+
+    def client(chunk):
+        samples = []
+        for path in chunk:
+            start = time.perf_counter()
+            result = detect_food_local(path)
+            assert result['success'], result
+            samples.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(samples)
+
+    threads = [threading.Thread(target=client, args=(chunk,)) for chunk in chunks]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    p50, p99 = np.percentile(np.array(latencies) * 1000, [50, 99])
+    print(f'{label:<12} {len(paths) / elapsed:8.1f} 张/秒  p50 {p50:7.1f} ms  p99 {p99:7.1f} ms')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--foods', type=int, default=20)
+    parser.add_argument('--refs', type=int, default=20)
+    parser.add_argument('--images', type=int, default=400)
+    parser.add_argument('--clients', type=int, default=16)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ref_folder, paths = prepare(tmp, args.foods, args.refs, args.images)
+        app.config['FOOD_REFERENCE_FOLDER'] = ref_folder
+        app.config['FOOD_INDEX_PATH'] = os.path.join(tmp, 'index.npz')
+        FoodRecognizer.build(ref_folder).save(app.config['FOOD_INDEX_PATH'])
+        food_batcher.reload()
+        # 关闭识别结果缓存，每张图片都走完整识别流程
+        app_module.recognition_cache = RecognitionCache(0, -1)
+        print(f'{len(food_batcher.model.labels)}张参考图片，{args.images}张待识别图片，{args.clients}个并发客户端')
+
+        batch_size = app.config['FOOD_BATCH_MAX_SIZE']
+        app.config['FOOD_BATCH_MAX_SIZE'] = 1
+        run('逐张识别', paths, args.clients)
+        app.config['FOOD_BATCH_MAX_SIZE'] = batch_size
+        run(f'凑批(≤{batch_size})', paths, args.clients)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""索引基准测试：对比旧数据库补建索引前后热点查询的执行计划和耗时
+
+用法：python benchmarks/bench_indexes.py [--players 300] [--records 200000] [--foods 50000]
+
+先按模型建表并删除所有二级索引，模拟升级前的sports_team.db；
+写入测试数据后对每个热点查询执行EXPLAIN QUERY PLAN并计时，
+再调用migrate_schema()补建索引后重复一遍。
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, select, text  # noqa: E402
+from app import db, migrate_schema, Player, TrainingPlan, TrainingRecord, FoodRecord  # noqa: E402
+
+player_t = Player.__table__
+plan_t = TrainingPlan.__table__
+record_t = TrainingRecord.__table__
+food_t = FoodRecord.__table__
+
+SPORT_ID = 1
+USER_ID = 1
+
+HOT_QUERIES = {
+    '球员列表': select(player_t).where(player_t.c.sport_id == SPORT_ID)
+        .order_by(player_t.c.number, player_t.c.id).limit(50),
+    '首页最新球员': select(player_t).where(player_t.c.sport_id == SPORT_ID)
+        .order_by(player_t.c.join_date.desc()).limit(3),
+    '计划列表': select(plan_t).where(plan_t.c.sport_id == SPORT_ID)
+        .order_by(plan_t.c.plan_date.desc(), plan_t.c.id.desc()).limit(50),
+    '项目训练记录': select(record_t).join(player_t).where(record_t.c.sport_id == SPORT_ID)
+        .order_by(record_t.c.record_time.desc(), record_t.c.id.desc()).limit(50),
+    '球员详情记录': select(record_t).where(record_t.c.player_id == 7)
+        .order_by(record_t.c.record_time.desc()),
+    '计划详情记录': select(record_t).where(record_t.c.plan_id == 7)
+        .order_by(record_t.c.record_time.desc()),
+    '饮食记录列表': select(food_t).where(food_t.c.user_id == USER_ID)
+        .order_by(food_t.c.create_time.desc(), food_t.c.id.desc()).limit(50),
+}
+
+
+def populate(engine, players, records, foods):
+    rnd = random.Random(42)
+    base = datetime(2020, 1, 1)
+    sports = 8
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO sport (id, name, positions) VALUES " +
+                          ", ".join(f"({i}, 'sport{i}', '')" for i in range(1, sports + 1))))
+        conn.execute(text("INSERT INTO user (id, username, password, email) VALUES (1, 'u1', 'x', 'u1@x')"))
+        conn.execute(player_t.insert(), [
+            dict(id=i, name=f'p{i}', number=i % 99, position='x', sport_id=1 + i % sports,
+                 join_date=base + timedelta(days=i))
+            for i in range(1, players + 1)])
+        plans = players // 2
+        conn.execute(plan_t.insert(), [
+            dict(id=i, title=f'plan{i}', plan_date=(base + timedelta(days=i)).date(), sport_id=1 + i % sports)
+            for i in range(1, plans + 1)])
+        player_ids = [rnd.randint(1, players) for _ in range(records)]
+        conn.execute(record_t.insert(), [
+            dict(player_id=player_id, sport_id=1 + player_id % sports, plan_id=rnd.randint(1, plans),
+                 score=rnd.randint(1, 10), record_time=base + timedelta(minutes=i))
+            for i, player_id in enumerate(player_ids)])
+        conn.execute(food_t.insert(), [
+            dict(user_id=1 + i % 20, food_name='米饭', calories=116, weight=100,
+                 create_time=base + timedelta(minutes=i))
+            for i in range(foods)])
+
+
+def run_queries(engine, label, repeat=20):
+    print(f'\n===== {label} =====')
+    with engine.connect() as conn:
+        for name, stmt in HOT_QUERIES.items():
+            sql = str(stmt.compile(engine, compile_kwargs={'literal_binds': True}))
+            plan = [row[-1] for row in conn.execute(text('EXPLAIN QUERY PLAN ' + sql))]
+            start = time.perf_counter()
+            for _ in range(repeat):
+                conn.execute(stmt).fetchall()
+            elapsed = (time.perf_counter() - start) / repeat * 1000
+            print(f'{name:<8} {elapsed:8.2f} ms  | ' + ' ; '.join(plan))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--players', type=int, default=300)
+    parser.add_argument('--records', type=int, default=200000)
+    parser.add_argument('--foods', type=int, default=50000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        db.metadata.create_all(engine)
+        for table in db.metadata.sorted_tables:
+            for index in table.indexes:
+                index.drop(engine)
+        populate(engine, args.players, args.records, args.foods)
+
+        run_queries(engine, '迁移前（仅主键/唯一索引）')
+        created = migrate_schema(engine)
+        print(f'\n补建索引：{", ".join(created)}')
+        print(f'再次执行迁移新建：{migrate_schema(engine) or "无（幂等）"}')
+        run_queries(engine, '迁移后')
+        engine.dispose()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""登录风暴基准测试：对比请求线程内计算bcrypt与PasswordHasher进程池下其他路由的响应延迟
+
+用法：python benchmarks/bench_password_hash.py [--logins 16] [--probes 2] [--seconds 5] [--rounds 12]
+
+在临时SQLite数据库中注册一个用户，随后由多个线程持续POST /login，
+同时探测线程循环请求不需要计算哈希的页面（GET /login），
+统计登录成功数、503数，以及探测请求的p50/p99延迟。
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+import threading
+
+tmp = tempfile.TemporaryDirectory()
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(tmp.name, 'bench.db')}"
+os.environ['SESSION_BACKEND'] = 'cookie'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+import app as app_module  # noqa: E402
+from app import app, db, bcrypt, User, PasswordHasher  # noqa: E402
+
+
+def login_loop(stop, counters, lock):
+    client = app.test_client()
+    ok = busy = 0
+    while not stop.is_set():
+        status = client.post('/login', data={'username': 'bench', 'password': 'secret'}).status_code
+        if status == 503:
+            busy += 1
+        else:
+            ok += 1
+    with lock:
+        counters['ok'] += ok
+        counters['busy'] += busy
+
+
+def probe_loop(stop, latencies, lock):
+    client = app.test_client()
+    samples = []
+    while not stop.is_set():
+        start = time.perf_counter()
+        client.get('/login')
+        samples.append(time.perf_counter() - start)
+    with lock:
+        latencies.extend(samples)
+
+
+def run(label, hasher, logins, probes, seconds):
+    app_module.password_hasher = hasher
+    counters = {'ok': 0, 'busy': 0}
+    latencies = []
+    lock = threading.Lock()
+    stop = threading.Event()
+    threads = [threading.Thread(target=login_loop, args=(stop, counters, lock)) for _ in range(logins)]
+    threads += [threading.Thread(target=probe_loop, args=(stop, latencies, lock)) for _ in range(probes)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    p50, p99 = np.percentile(np.array(latencies) * 1000, [50, 99]) if latencies else (0, 0)
+    print(f'{label:<10} 登录 {counters["ok"] / seconds:6.1f} 次/秒  503 {counters["busy"]:5d}  '
+          f'其他路由 {len(latencies) / seconds:7.1f} 次/秒  p50 {p50:7.1f} ms  p99 {p99:7.1f} ms')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--logins', type=int, default=16)
+    parser.add_argument('--probes', type=int, default=2)
+    parser.add_argument('--seconds', type=float, default=5)
+    parser.add_argument('--rounds', type=int, default=12)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    with open(os.path.join(tmp.name, 'login.html'), 'w') as f:
+        f.write('login')
+    app.jinja_loader.searchpath.insert(0, tmp.name)
+    app.config['BCRYPT_LOG_ROUNDS'] = bcrypt._log_rounds = args.rounds
+    with app.app_context():
+        db.create_all()
+        db.session.add(User(username='bench', email='bench@example.com',
+                            password=bcrypt.generate_password_hash('secret').decode('utf-8')))
+        db.session.commit()
+
+    run('请求线程内', PasswordHasher(0, 0, 10), args.logins, args.probes, args.seconds)
+    pool = PasswordHasher(args.workers, 4 * args.workers, 10)
+    run('进程池', pool, args.logins, args.probes, args.seconds)
+    pool._pool().shutdown()
+    tmp.cleanup()
+
+
+if __name__ == '__main__':
+    main()
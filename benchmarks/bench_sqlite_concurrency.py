@@ -0,0 +1,100 @@
+"""SQLite并发写入基准测试：对比默认设置与SQLITE_PRAGMAS（WAL等）下的写入吞吐量
+
+用法：python benchmarks/bench_sqlite_concurrency.py [--writers 8] [--readers 4] [--seconds 5]
+
+每个写线程循环执行与保存饮食记录/添加训练记录相同形状的事务：
+读取项目统计 -> 插入一行明细 -> 更新统计行 -> 提交；读线程同时查询最新记录。
+分别统计成功提交的事务数、database is locked错误数和读查询数。
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+import threading
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, select, func  # noqa: E402
+from sqlalchemy.exc import OperationalError  # noqa: E402
+from app import app, db, FoodRecord, SportStats  # noqa: E402
+
+food_t = FoodRecord.__table__
+stats_t = SportStats.__table__
+
+# 旧配置：回滚日志 + synchronous=FULL，遇锁等待时间与sqlite3模块默认值一致
+DEFAULT_PRAGMAS = {'journal_mode': 'DELETE', 'synchronous': 'FULL', 'busy_timeout': 5000}
+
+
+def write_loop(engine, stop, counters, lock):
+    committed = locked = 0
+    while not stop.is_set():
+        try:
+            with engine.begin() as conn:
+                conn.execute(select(stats_t.c.record_count).where(stats_t.c.sport_id == 1)).scalar()
+                conn.execute(food_t.insert().values(user_id=1, food_name='米饭', calories=116, weight=100,
+                                                    create_time=datetime.now()))
+                conn.execute(stats_t.update().where(stats_t.c.sport_id == 1)
+                             .values(record_count=stats_t.c.record_count + 1))
+            committed += 1
+        except OperationalError as e:
+            if 'locked' not in str(e):
+                raise
+            locked += 1
+    with lock:
+        counters['committed'] += committed
+        counters['locked'] += locked
+
+
+def read_loop(engine, stop, counters, lock):
+    reads = 0
+    while not stop.is_set():
+        with engine.connect() as conn:
+            conn.execute(select(food_t).order_by(food_t.c.id.desc()).limit(50)).fetchall()
+            conn.execute(select(func.count()).select_from(food_t)).scalar()
+        reads += 1
+    with lock:
+        counters['reads'] += reads
+
+
+def run(label, pragmas, writers, readers, seconds):
+    app.config['SQLITE_PRAGMAS'] = pragmas
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}",
+                               pool_size=writers + readers, max_overflow=0)
+        db.metadata.create_all(engine)
+        with engine.begin() as conn:
+            conn.execute(stats_t.insert().values(sport_id=1))
+        counters = {'committed': 0, 'locked': 0, 'reads': 0}
+        lock = threading.Lock()
+        stop = threading.Event()
+        threads = [threading.Thread(target=write_loop, args=(engine, stop, counters, lock)) for _ in range(writers)]
+        threads += [threading.Thread(target=read_loop, args=(engine, stop, counters, lock)) for _ in range(readers)]
+        for thread in threads:
+            thread.start()
+        time.sleep(seconds)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        with engine.connect() as conn:
+            mode = conn.exec_driver_sql('PRAGMA journal_mode').scalar()
+        engine.dispose()
+    print(f'{label:<10} journal={mode:<7} 写入 {counters["committed"] / seconds:8.0f} 事务/秒  '
+          f'locked错误 {counters["locked"]:5d}  读取 {counters["reads"] / seconds:8.0f} 次/秒')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--writers', type=int, default=8)
+    parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument('--seconds', type=float, default=5)
+    args = parser.parse_args()
+
+    tuned = dict(app.config['SQLITE_PRAGMAS'])
+    run('默认设置', DEFAULT_PRAGMAS, args.writers, args.readers, args.seconds)
+    run('调优后', tuned, args.writers, args.readers, args.seconds)
+
+
+if __name__ == '__main__':
+    main()